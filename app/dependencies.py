@@ -9,6 +9,7 @@ from sqlalchemy.orm import sessionmaker
 from datetime import datetime, timedelta
 from jose import jwt, JWTError  # ✅ Make sure JWTError is imported
 import redis
+from app.utils.db_profiler import attach_query_profiler
 
 # ✅ Load .env from the project root
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,12 +27,22 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_USERNAME = os.getenv("REDIS_USERNAME")
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
+# ✅ Response compression (bytes; smaller bodies are sent uncompressed)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+
+# ✅ Opt-in DB query profiling (Server-Timing headers, slow-query and N+1 logging)
+DB_PROFILING = os.getenv("DB_PROFILING", "false").lower() in ("1", "true", "yes")
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "100"))
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "3"))
+
 # ✅ Validate .env loading
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL not loaded — check your .env file path or variable names.")
 
 # ✅ SQLAlchemy setup
 engine = create_engine(DATABASE_URL)
+if DB_PROFILING:
+    attach_query_profiler(engine, DB_SLOW_QUERY_MS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # ✅ Redis client factory
@@ -1,12 +1,21 @@
 from fastapi import FastAPI
+from brotli_asgi import BrotliMiddleware
 from app.models import Base
-from app.dependencies import engine
+from app.dependencies import engine, COMPRESSION_MIN_SIZE, DB_PROFILING, DB_N_PLUS_ONE_THRESHOLD
+from app.utils.db_profiler import query_profiler_middleware
 from app.routes import auth, user, chatroom, stripe, subscription
 
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title="Gemini Backend Clone")
 
+# ✅ Negotiated compression: brotli when accepted, gzip fallback, small bodies left as-is
+app.add_middleware(BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True)
+
+# ✅ Per-request DB query profiling (enable with DB_PROFILING=true)
+if DB_PROFILING:
+    app.middleware("http")(query_profiler_middleware(DB_N_PLUS_ONE_THRESHOLD))
+
 app.include_router(auth.router)
 app.include_router(user.router)
 app.include_router(chatroom.router)
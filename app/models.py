@@ -2,7 +2,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Bool
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from app.dependencies import engine
 
 Base = declarative_base()
@@ -15,6 +15,7 @@ class User(Base):
     password_hash = Column(String, nullable=True) # CHANGED: Renamed for clarity and security
     tier = Column(String, default="Basic")
     is_pro = Column(Boolean, default=False) # ADDED: For rate limiting logic
+    version = Column(Integer, nullable=False, server_default="1", onupdate=literal_column("version + 1")) # ADDED: Bumped on every UPDATE, used for ETags
 
     chatrooms = relationship("Chatroom", back_populates="creator")
     messages = relationship("Message", back_populates="user")
@@ -25,6 +26,7 @@ class Chatroom(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    version = Column(Integer, nullable=False, server_default="1", onupdate=literal_column("version + 1")) # ADDED: Bumped on every UPDATE, used for ETags
 
     creator = relationship("User", back_populates="chatrooms")
     messages = relationship("Message", back_populates="chatroom")
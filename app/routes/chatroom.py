@@ -1,11 +1,12 @@
 # app/routes/chatroom.py
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks # Import BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
 from sqlalchemy.orm import Session
 from app.dependencies import get_db, get_current_user, redis_client # Import redis_client
 from app import schemas, models
 from typing import List
 from datetime import date
 from app.utils.gemini import generate_content # Ensure this import path is correct
+from app.utils.etag import make_etag, not_modified
 
 import time # Needed for rate limiting key expiration
 
@@ -72,24 +73,44 @@ def create_chatroom(
 # ✅ GET /chatroom — List all chatrooms for the current user
 @router.get("", response_model=List[schemas.ChatroomResponse])
 def list_user_chatrooms(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     user=Depends(get_current_user)
 ):
-    room_ids = (
-        db.query(models.ChatMember.chatroom_id)
-        .filter_by(user_id=user.id)
+    # Only ids + version stamps first, so a matching ETag skips loading full rows
+    stamps = (
+        db.query(models.Chatroom.id, models.Chatroom.version)
+        .join(models.ChatMember, models.ChatMember.chatroom_id == models.Chatroom.id)
+        .filter(models.ChatMember.user_id == user.id)
+        .order_by(models.Chatroom.id)
         .all()
     )
-    ids = [r[0] for r in room_ids]
+    etag = make_etag("chatrooms", user.id, *(f"{room_id}.{version}" for room_id, version in stamps))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    ids = [room_id for room_id, _ in stamps]
     return db.query(models.Chatroom).filter(models.Chatroom.id.in_(ids)).all()
 
 
 # ✅ GET /chatroom/{id} — Get chatroom details
 @router.get("/{id}", response_model=schemas.ChatroomResponse)
-def get_chatroom(id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
+def get_chatroom(
+    id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+):
     room = db.query(models.Chatroom).filter_by(id=id).first()
     if not room:
         raise HTTPException(status_code=404, detail="Chatroom not found")
+
+    cached = not_modified(request, response, make_etag("chatroom", room.id, room.version))
+    if cached is not None:
+        return cached
     return room
 
 
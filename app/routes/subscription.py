@@ -1,9 +1,10 @@
 # routes/subscription.py
-from fastapi import APIRouter, Depends, Request, HTTPException, status, Header
+from fastapi import APIRouter, Depends, Request, Response, HTTPException, status, Header
 from sqlalchemy.orm import Session
 from app.dependencies import get_current_user, get_db
 from app.models import User
 from app.schemas import SubscriptionStatusResponse
+from app.utils.etag import make_etag, not_modified
 from dotenv import load_dotenv
 import stripe
 import os
@@ -93,5 +94,8 @@ async def stripe_webhook(
 
 # 3. Get Subscription Tier
 @router.get("/subscription/status", response_model=SubscriptionStatusResponse)
-def get_subscription_status(user: User = Depends(get_current_user)):
+def get_subscription_status(request: Request, response: Response, user: User = Depends(get_current_user)):
+    cached = not_modified(request, response, make_etag("subscription", user.id, user.version))
+    if cached is not None:
+        return cached
     return {"tier": user.tier}
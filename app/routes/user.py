@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from app.dependencies import get_current_user
 from app.models import User
 from app.schemas import UserProfileResponse
+from app.utils.etag import make_etag, not_modified
 
 router = APIRouter(prefix="/user", tags=["User"])
 
 @router.get("/me", response_model=UserProfileResponse, status_code=status.HTTP_200_OK)
-def get_profile(current_user: User = Depends(get_current_user)):
+def get_profile(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    cached = not_modified(request, response, make_etag("user", current_user.id, current_user.version))
+    if cached is not None:
+        return cached
     return current_user
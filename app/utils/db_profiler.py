@@ -0,0 +1,88 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.db_profiler")
+
+
+class RequestQueryStats:
+    """Queries issued while serving one request."""
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes = Counter()
+
+    @property
+    def route(self) -> str:
+        # "route" is only filled in once the router has matched the request
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "?")
+        return f"{self.scope.get('method', '?')} {path}"
+
+    def repeated(self, threshold: int) -> dict:
+        return {sql: n for sql, n in self.shapes.items() if n >= threshold}
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+# ✅ Hook timing listeners onto the engine (statements are recorded only inside a profiled request)
+def attach_query_profiler(engine: Engine, slow_query_ms: float):
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        stats = _current_stats.get()
+        if stats is None:
+            return
+
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        # Bound parameters are not part of the statement text, so identical
+        # text means the same query shape
+        stats.shapes[statement] += 1
+
+        if elapsed_ms >= slow_query_ms:
+            logger.warning("Slow query (%.1f ms) on %s: %s", elapsed_ms, stats.route, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # Keep the timing stack balanced when a statement fails
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+
+# ✅ HTTP middleware: per-request query count / DB time as Server-Timing, N+1 warnings in the log
+def query_profiler_middleware(n_plus_one_threshold: int):
+    async def profile_db_queries(request: Request, call_next):
+        stats = RequestQueryStats(request.scope)
+        token = _current_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+
+        timings = [f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"']
+
+        repeated = stats.repeated(n_plus_one_threshold)
+        if repeated:
+            timings.append(f'db-repeated;desc="{len(repeated)} repeated statements"')
+            for sql, n in repeated.items():
+                logger.warning("Probable N+1 on %s: statement ran %d times: %s", stats.route, n, sql)
+
+        response.headers.append("Server-Timing", ", ".join(timings))
+        return response
+
+    return profile_db_queries
@@ -0,0 +1,34 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+# ✅ Build a weak ETag from cheap version stamps (ids, version counters)
+# Weak because the compression middleware re-encodes the body per client.
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+# ✅ Conditional GET helper
+# Sets the validator on the outgoing response and returns a ready 304 when the
+# client's If-None-Match already holds it, otherwise None.
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None